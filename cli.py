@@ -4,11 +4,21 @@ Command Line Interface for the Issue Generator tool.
 """
 
 import argparse
+import logging
 import sys
 import time
 import os # Import os
+from typing import Union
 
-from issue_generator import TemplateManager, OllamaClient, IssueGenerator
+log = logging.getLogger(__name__)
+
+
+def keep_alive_duration(value: str) -> Union[str, int]:
+    """Parse --keep-alive: Ollama reads plain numbers as seconds, strings need a unit like '30m'."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
 
 
 def main():
@@ -18,58 +28,73 @@ def main():
     parser.add_argument("--type", choices=["epic", "story", "adoc", "docs", "bug"], default="story", help="Type of issue to generate (epic, story, or adoc)")
     parser.add_argument("--output", help="Output file (stdout if not specified)")
     parser.add_argument("--model", default="gemma3:12b", help="Ollama model to use")
+    parser.add_argument("--host", action="append", dest="hosts", help="Ollama server URL (default: http://localhost:11434); repeat to spread requests over several servers")
+    parser.add_argument("--no-batch", action="store_true", help="Generate every field with its own request instead of a single JSON request")
+    parser.add_argument("--stream", action="store_true", help="Write the output file while fields are being generated (requires --output)")
+    parser.add_argument("--keep-alive", type=keep_alive_duration, help="How long Ollama keeps the model loaded after the last request, e.g. 30m or -1 for always (default: the Ollama server's setting)")
+    parser.add_argument("--num-ctx", type=int, help="Context window size in tokens (default: the Ollama server's setting)")
+    parser.add_argument("--num-batch", type=int, help="Prompt tokens processed per step while reading the prompt (default: the Ollama server's setting)")
+    parser.add_argument("--no-token-limit", action="store_true", help="Do not cap the generated tokens of a field; needed for models that think before answering")
+    parser.add_argument("--timeout", type=float, help="Seconds to wait for Ollama before retrying a request (default: no limit)")
+    parser.add_argument("--verbose", action="store_true", help="Also show token counts and timing of every request")
     parser.add_argument("--quality", choices=["high", "medium", "low"], help="Quality setting for models that support it (e.g., gpt-oss:latest)")
     
     args = parser.parse_args()
+    if args.stream and not args.output:
+        parser.error("--stream requires --output")
+
+    # Imported after argument parsing so --help and usage errors stay fast
+    from issue_generator import TemplateManager, OllamaClient, IssueGenerator
+    from issue_generator.log_format import GREEN, GREY, setup_logging
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
 
     # Read the context from the specified file
     try:
         with open(args.context, 'r') as file:
             context = file.read()
     except FileNotFoundError:
-        print(f"\033[91mError: Context file '{args.context}' not found\033[0m")
+        log.error("Error: Context file '%s' not found", args.context)
         sys.exit(1)
     except Exception as e:
-        print(f"\033[91mError reading context file: {str(e)}\033[0m")
+        log.error("Error reading context file: %s", e)
         sys.exit(1)
 
-    print(f"\033[90mInitializing issue generator with model: {args.model}\033[0m")
+    log.info("Initializing issue generator with model: %s", args.model, extra={"color": GREY})
     
     # Set template based on issue type
     template_name = f"{args.type}_template.txt"
     template_dir = "templates"  # Hardcoded template directory
     
-    # Define path to prompts config relative to this script's location or a fixed path
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    prompt_config_path = os.path.join(script_dir, 'issue_generator', 'prompts-config.json')
-    
     # Determine output format based on type
     output_format = 'adoc' if args.type == 'adoc' else 'jira'
-    print(f"\033[90mOutput format set to: {output_format}\033[0m")
+    log.info("Output format set to: %s", output_format, extra={"color": GREY})
 
     # Initialize components
     try:
-        template_manager = TemplateManager(template_dir, prompt_config_path)
+        template_manager = TemplateManager(template_dir)
         system_prompt = template_manager.get_system_prompt()
-        ollama_client = OllamaClient(model=args.model, system_prompt=system_prompt, quality=args.quality)
-        issue_generator = IssueGenerator(template_manager=template_manager, ollama_client=ollama_client, output_format=output_format)
+        ollama_client = OllamaClient(model=args.model, system_prompt=system_prompt, quality=args.quality, hosts=args.hosts,
+                                     request_timeout=args.timeout, num_ctx=args.num_ctx,
+                                     num_batch=args.num_batch, keep_alive=args.keep_alive)
+        issue_generator = IssueGenerator(template_manager=template_manager, ollama_client=ollama_client, output_format=output_format, batch_fields=not args.no_batch,
+                                         limit_tokens=not args.no_token_limit)
     except FileNotFoundError as e:
-        print(f"\033[91mInitialization Error: {str(e)}\033[0m")
+        log.error("Initialization Error: %s", e)
         sys.exit(1)
     except Exception as e:
-        print(f"\033[91mUnexpected Initialization Error: {str(e)}\033[0m")
+        log.error("Unexpected Initialization Error: %s", e)
         sys.exit(1)
 
     # Generate the issue
     try:
-        print(f"\033[90mLoading template for {args.type}: {template_name}\033[0m")
-        print(f"\033[90mGenerating {args.type} from context file: '{args.context}'\033[0m")
-        
-        start_time = time.time()
-        issue_content = issue_generator.generate_full_issue(context, template_name)
-        end_time = time.time()
+        log.info("Loading template for %s: %s", args.type, template_name, extra={"color": GREY})
+        log.info("Generating %s from context file: '%s'", args.type, args.context, extra={"color": GREY})
         
-        generation_time = end_time - start_time
+        start_time = time.perf_counter()
+        if args.stream:
+            issue_content = issue_generator.generate_full_issue_stream(context, template_name)
+        else:
+            issue_content = issue_generator.generate_full_issue(context, template_name)
         
         # Output the result
         if args.output:
@@ -81,17 +106,26 @@ def main():
             output_path = os.path.join(output_dir, args.output)
             
             with open(output_path, 'w') as f:
-                f.write(issue_content)
-            print(f"\033[92m{args.type.capitalize()} written to {output_path}\033[0m")
+                if args.stream:
+                    # Write chunks as they arrive so the file fills up during generation
+                    for chunk in issue_content:
+                        f.write(chunk)
+                        f.flush()
+                else:
+                    f.write(issue_content)
+            log.info("%s written to %s", args.type.capitalize(), output_path, extra={"color": GREEN})
         else:
             print(f"\n--- Generated {args.type.capitalize()} ---\n")
             print(issue_content)
             print("\n----------------------\n")
         
-        print(f"\033[92mGeneration completed in {generation_time:.2f} seconds\033[0m")
+        generation_time = time.perf_counter() - start_time
+        log.info("Generation completed in %.2f seconds", generation_time, extra={"color": GREEN})
     except Exception as e:
-        print(f"\033[91mError: {str(e)}\033[0m")
+        log.error("Error: %s", e)
         sys.exit(1)
+    finally:
+        ollama_client.close()
 
 
 if __name__ == "__main__":
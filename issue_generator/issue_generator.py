@@ -2,18 +2,70 @@
 Issue generator module for creating issues from templates using AI.
 """
 
+import asyncio
+import json
+import logging
 import re
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 from .template_manager import TemplateManager
 from .ollama_client import OllamaClient
 from .placeholder_types import PlaceholderTypes
 
+try:
+    # Optional: orjson parses the batched response faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+log = logging.getLogger(__name__)
+
+
+# Matches template placeholders like {{ field_name }}
+_FIELD_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Rough relative generation time per placeholder type, used to start slow fields first
+_GENERATION_COST = {"header": 1, "selection": 1, "sentence": 2, "bullets": 5, "numbered": 5, "tables": 8}
+
+# Upper bound on generated tokens per placeholder type, derived from its configured
+# limits with plenty of headroom: it only stops a model that does not stop by itself
+_MAX_TOKENS = {
+    "header": lambda args: 32 + 4 * args["word_limit"],
+    "sentence": lambda args: 64 + 4 * args["word_limit"],
+    "bullets": lambda args: 64 + 96 * args["bullet_limit"],
+    "numbered": lambda args: 64 + 96 * args["step_limit"],
+    "selection": lambda args: 128,
+}
+
+# Args limiting the size of a field; a limit of 0 leaves nothing to generate
+_LIMIT_ARGS = ("word_limit", "bullet_limit", "step_limit", "table_limit")
+
+# Explanations in brackets after a selection option, e.g. 'Tester (Related to QA)'
+_OPTION_NOTE_RE = re.compile(r'\s*\([^)]*\)')
+
+# Token limit for fields without a type specific one, as in OllamaClient.generate_text
+_DEFAULT_MAX_TOKENS = 2048
+
+# Token limit for a batched request: the combined answer is much longer than a single field
+_BATCH_MAX_TOKENS = 8192
+
+# Instructions for requesting all fields at once, completed with str.format
+_BATCH_RULES = """
+Generate the content for each of the following fields by following its instructions.
+
+{field_rules}
+
+Return a JSON object with exactly these keys: {keys}.
+Every value is a string with the generated text for that field, formatted as its instructions describe.
+"""
+
 
 class IssueGenerator:
     """Generates issue descriptions from templates using AI."""
     
-    def __init__(self, template_manager: TemplateManager, ollama_client: OllamaClient, output_format: str = 'jira'):
+    def __init__(self, template_manager: TemplateManager, ollama_client: OllamaClient, output_format: str = 'jira',
+                 batch_fields: bool = True, enable_cache: bool = True, limit_tokens: bool = True):
         """
         Initialize the IssueGenerator.
         
@@ -21,39 +73,86 @@ class IssueGenerator:
             template_manager: Manager for loading and rendering templates
             ollama_client: Pre-initialized client for generating text with Ollama
             output_format: The desired output format ('jira' or 'adoc')
+            batch_fields: Request all fields in a single JSON response before
+                falling back to one request per field
+            enable_cache: Reuse responses of identical earlier requests made
+                through the same client
+            limit_tokens: Cap the generated tokens of a field based on its limits.
+                Disable for reasoning models, which spend tokens on thinking first
         """
         self.template_manager = template_manager
         self.ollama_client = ollama_client
         self.prompts = self.template_manager.get_template_prompts()
         self.output_format = output_format
+        self.batch_fields = batch_fields
+        self.enable_cache = enable_cache
         self.placeholder_types = PlaceholderTypes(ollama_client, output_format)
+        
+        # Rules builder per generation type, with the config args it takes and their defaults
+        self._rules_builders = {
+            "header": (self.placeholder_types.header_rules, {"word_limit": 7}),
+            "sentence": (self.placeholder_types.sentence_rules, {"word_limit": 50}),
+            "bullets": (self.placeholder_types.bullets_rules, {"bullet_limit": 5}),
+            "numbered": (self.placeholder_types.numbered_rules, {"step_limit": 5}),
+            "selection": (self.placeholder_types.selection_rules, {"options": []}),
+            "tables": (self.placeholder_types.tables_rules, {"table_limit": 1, "table_title": "", "table_headers": ("Header1", "Header2")}),
+        }
+        
+        # Everything but the context is fixed per field, so build those instructions once
+        self._field_rules = {}
+        self._field_max_tokens = {}
+        self._field_formats = {}
+        self._field_answers = {}
+        for field in self.prompts:
+            try:
+                rules = self._build_rules(field)
+            except ValueError:
+                continue  # Reported when the field is generated
+            self._field_rules[field] = rules
+            generation_type = self.prompts[field]["type"]
+            if limit_tokens and generation_type in _MAX_TOKENS:
+                self._field_max_tokens[field] = _MAX_TOKENS[generation_type](self._type_args(field))
+            if generation_type == "selection":
+                self._field_formats[field] = self._selection_schema(
+                    self._type_args(field)["options"], self.prompts[field]["args"].get("multiple", False))
+            answer = self._fixed_answer(field)
+            if answer is not None:
+                self._field_answers[field] = answer
 
-    def _extract_template_fields(self, template_content: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _extract_template_fields(template_content: str) -> Tuple[str, ...]:
         """
         Extract fields (placeholders) from a template file.
         
+        Results are cached per template content, so rendering the same template
+        again skips the scan.
+        
         Args:
             template_content: The content of the template file
             
         Returns:
-            List of field names extracted from the template
+            Tuple of field names extracted from the template
         """
-        # Regular expression to find all placeholders like {{ field_name }}
-        fields = re.findall(r'{{\s*(\w+)\s*}}', template_content)
+        # Skip the regex scan for templates without any placeholder
+        if "{{" not in template_content:
+            return ()
         
-        # Return unique field names
-        return list(set(fields))
+        # Return unique field names in order of first appearance
+        return tuple(dict.fromkeys(_FIELD_RE.findall(template_content)))
 
-    def generate_issue_content(self, context: str, field: str) -> str:
+    def _build_rules(self, field: str) -> str:
         """
-        Generate content for a specific field of an issue.
+        Build the instructions for a specific field of an issue.
         
         Args:
-            context: User-provided context for the issue
-            field: Field to generate content for (e.g., 'description', 'acceptance_criteria')
+            field: Field to build the instructions for (e.g., 'description', 'acceptance_criteria')
             
         Returns:
-            Generated content for the field
+            Instructions for the field, without the user context
+            
+        Raises:
+            ValueError: If the field is unknown or its configuration is invalid
         """
         # self.prompts now correctly points to the 'template_prompts' dictionary
         if field not in self.prompts:
@@ -62,52 +161,262 @@ class IssueGenerator:
         # Get the prompt configuration for the specific field
         prompt_config = self.prompts[field]
         
-        # Check if the prompt has a type and use the appropriate generation function
-        if "type" in prompt_config:
-            generation_type = prompt_config["type"]
-            additional_info = prompt_config.get("additional_info", '')
-            
-            if generation_type == "header":
-                word_limit = prompt_config.get("args", {}).get("word_limit", 7)
-                return self.placeholder_types.generate_header(context, word_limit, additional_info)
-            
-            elif generation_type == "sentence":
-                word_limit = prompt_config.get("args", {}).get("word_limit", 50)
-                return self.placeholder_types.generate_sentence(context, word_limit, additional_info)
-            
-            elif generation_type == "bullets":
-                bullet_limit = prompt_config.get("args", {}).get("bullet_limit", 5)
-                return self.placeholder_types.generate_bullets(context, bullet_limit, additional_info)
+        # Fields without a type are not supported by a rules builder
+        if "type" not in prompt_config:
+            raise ValueError(f"Field {field} has no generation type")
+        
+        generation_type = prompt_config["type"]
+        if generation_type not in self._rules_builders:
+            raise ValueError(f"Unsupported generation type: {generation_type}")
+        
+        builder, _ = self._rules_builders[generation_type]
+        args = self._type_args(field)
+        if generation_type == "selection" and not args["options"]:
+            raise ValueError("Options list is required for 'selection' generation type")
+        
+        return builder(additional_info=prompt_config.get("additional_info", ''), **args)
+
+    def _type_args(self, field: str) -> Dict[str, Any]:
+        """Return the args of a field's generation type, configured values over defaults."""
+        prompt_config = self.prompts[field]
+        _, defaults = self._rules_builders[prompt_config["type"]]
+        config_args = prompt_config.get("args", {})
+        return {name: config_args.get(name, default) for name, default in defaults.items()}
+
+    def _selection_schema(self, options: List[str], multiple: bool = False) -> Dict[str, Any]:
+        """
+        JSON schema that only lets Ollama answer with the given options.
+        
+        Explanations in brackets are left out, as the instructions ask. The answer
+        is a list of exactly one option, or of several for fields whose args set
+        "multiple": true.
+        """
+        choices = list(dict.fromkeys(_OPTION_NOTE_RE.sub("", option).strip() for option in options))
+        schema = {"type": "array", "items": {"type": "string", "enum": choices}, "minItems": 1}
+        if not multiple:
+            schema["maxItems"] = 1
+        return schema
+
+    def _fixed_answer(self, field: str) -> Optional[str]:
+        """Return the content of a field that its configuration already determines, if any."""
+        if any(value == 0 for name, value in self._type_args(field).items() if name in _LIMIT_ARGS):
+            return ""
+        if field in self._field_formats:
+            choices = self._field_formats[field]["items"]["enum"]
+            if len(choices) == 1:
+                return choices[0]
+        return None
+
+    def _known_answer(self, context: str, field: str) -> Optional[str]:
+        """Return the content of a field that needs no request to Ollama, if any."""
+        if field in self._field_answers:
+            return self._field_answers[field]
+        # Without any input the model could only make something up
+        if not context.strip() and not self.prompts.get(field, {}).get("additional_info"):
+            return f"<!-- Missing content for {field} -->"
+        return None
+
+    def _field_answer(self, field: str, response: Any) -> str:
+        """
+        Turn the response for a field into its content, joining constrained selections.
+        
+        A field's own response is JSON text; in a batched response the value of a
+        selection field arrives already parsed.
+        """
+        if field not in self._field_formats:
+            return response
+        selected = response
+        if isinstance(response, str):
+            try:
+                selected = _json_loads(response)
+            except json.JSONDecodeError:
+                return response  # Server without structured output support
+        if isinstance(selected, list):
+            return ", ".join(str(option) for option in selected)
+        return str(selected)
+
+    def _capped_out(self, field: str, response: str) -> bool:
+        """
+        Whether a field came back empty while capped to its own token limit.
+        
+        Reasoning models spend tokens on thinking first, which may use up the
+        whole cap; the field is then requested again with the default limit.
+        """
+        if response.strip() or field not in self._field_max_tokens:
+            return False
+        log.warning("Warning: No content for %s within %d tokens, retrying without its token limit",
+                    field, self._field_max_tokens[field])
+        return True
+
+    def _request_key(self, field: str) -> Any:
+        """
+        Key shared by fields that need the exact same request.
+        
+        Besides the instructions, the token limit and the response format are part
+        of the request. Fields without precompiled rules are keyed by their name.
+        """
+        if field not in self._field_rules:
+            return field
+        return (self._field_rules[field], self._field_max_tokens.get(field),
+                json.dumps(self._field_formats.get(field), sort_keys=True))
+
+    def _field_order(self, field: str) -> Tuple[int, str]:
+        """Sort key putting the most expensive generation types first, grouped by type."""
+        generation_type = self.prompts.get(field, {}).get("type", "")
+        return -_GENERATION_COST.get(generation_type, 3), generation_type
+
+    def _field_prompt(self, context: str, field: str) -> str:
+        """Return the prompt for a field, adding the context to its precompiled instructions."""
+        if field not in self._field_rules:
+            # Raises the ValueError for unknown or invalid fields
+            return self.placeholder_types.with_context(self._build_rules(field), context)
+        return self.placeholder_types.with_context(self._field_rules[field], context)
+
+    def generate_issue_content(self, context: str, field: str) -> str:
+        """
+        Generate content for a specific field of an issue.
+        
+        Args:
+            context: User-provided context for the issue
+            field: Field to generate content for (e.g., 'description', 'acceptance_criteria')
             
-            elif generation_type == "numbered":
-                step_limit = prompt_config.get("args", {}).get("step_limit", 5)
-                return self.placeholder_types.generate_numbered(context, step_limit, additional_info)
+        Returns:
+            Generated content for the field
+        """
+        answer = self._known_answer(context, field)
+        if answer is not None:
+            return answer
+        
+        prompt = self._field_prompt(context, field)
+        response = self.ollama_client.generate_text(prompt,
+                                                    max_tokens=self._field_max_tokens.get(field, _DEFAULT_MAX_TOKENS),
+                                                    format=self._field_formats.get(field),
+                                                    no_cache=not self.enable_cache)
+        if self._capped_out(field, response):
+            response = self.ollama_client.generate_text(prompt, max_tokens=_DEFAULT_MAX_TOKENS,
+                                                        format=self._field_formats.get(field),
+                                                        no_cache=not self.enable_cache)
+        return self._field_answer(field, response)
+    
+    async def generate_issue_content_async(self, context: str, field: str) -> str:
+        """
+        Generate content for a specific field of an issue without blocking the event loop.
+        
+        Args:
+            context: User-provided context for the issue
+            field: Field to generate content for (e.g., 'description', 'acceptance_criteria')
             
-            elif generation_type == "selection":
-                options = prompt_config.get("args", {}).get("options", [])
-                if not options:
-                    raise ValueError("Options list is required for 'selection' generation type")
-                return self.placeholder_types.select_from_list(context, options, additional_info)
+        Returns:
+            Generated content for the field
+        """
+        answer = self._known_answer(context, field)
+        if answer is not None:
+            return answer
+        
+        log.info("Generating %s...", field)
+        prompt = self._field_prompt(context, field)
+        response = await self.ollama_client.agenerate_text(prompt,
+                                                           max_tokens=self._field_max_tokens.get(field, _DEFAULT_MAX_TOKENS),
+                                                           format=self._field_formats.get(field),
+                                                           no_cache=not self.enable_cache)
+        if self._capped_out(field, response):
+            response = await self.ollama_client.agenerate_text(prompt, max_tokens=_DEFAULT_MAX_TOKENS,
+                                                               format=self._field_formats.get(field),
+                                                               no_cache=not self.enable_cache)
+        return self._field_answer(field, response)
+    
+    def _batch_prompt(self, context: str, fields: List[str]) -> str:
+        """
+        Build the prompt asking for all fields as one JSON object.
+        
+        Each field keeps the instructions of its own placeholder type, tagged with
+        a [field_name] marker so the model can tell them apart.
+        """
+        field_rules = "\n".join(f"[{field}]\n{self._field_rules[field]}" for field in fields)
+        rules = _BATCH_RULES.format(field_rules=field_rules, keys=", ".join(fields))
+        return self.placeholder_types.with_context(rules, context)
+
+    def _batch_schema(self, fields: List[str]) -> Dict[str, Any]:
+        """
+        JSON schema for the batched response, so Ollama cannot leave out a field.
+        
+        Selection fields keep the schema that limits them to their options.
+        """
+        return {
+            "type": "object",
+            "properties": {field: self._field_formats.get(field, {"type": "string"}) for field in fields},
+            "required": list(fields),
+        }
+
+    def _parse_batch_response(self, response: str, fields: List[str]) -> Dict[str, str]:
+        """Extract the generated fields from a batched JSON response."""
+        try:
+            data = _json_loads(response)
+        except json.JSONDecodeError as e:  # orjson's error is a subclass
+            raise ValueError(f"Batched response is not valid JSON: {str(e)}")
+        if not isinstance(data, dict):
+            raise ValueError("Batched response is not a JSON object")
+        
+        issue_data = {}
+        for field in fields:
+            value = data.get(field)
+            if field in self._field_formats and value is not None:
+                value = self._field_answer(field, value)
+            elif isinstance(value, list):
+                value = "\n".join(str(item) for item in value)
+            if isinstance(value, str) and value.strip():
+                issue_data[field] = value.strip()
+        return issue_data
+
+    def generate_all_fields(self, context: str, fields: List[str]) -> Dict[str, str]:
+        """
+        Generate content for several fields with a single request.
+        
+        The model is asked for one JSON object keyed by field name, so the shared
+        context is only prefilled once instead of once per field.
+        
+        Args:
+            context: User-provided context for the issue
+            fields: Fields to generate content for
             
-            elif generation_type == "tables":
-                table_limit = prompt_config.get("args", {}).get("table_limit", 1)
-                # Process table_title format - replace placeholders like <abbreviation> if needed later
-                raw_title_format = prompt_config.get("args", {}).get("table_title", "") 
-                # Simple placeholder replacement for now, might need refinement
-                processed_title = raw_title_format # Placeholder for potential future logic
-                
-                table_headers = prompt_config.get("args", {}).get("table_headers", ["Header1", "Header2"])
-                
-                return self.placeholder_types.generate_tables(context, table_limit, processed_title, table_headers, additional_info)
+        Returns:
+            Generated content per field; fields the model left out are omitted
             
-            else:
-                raise ValueError(f"Unsupported generation type: {generation_type}")
+        Raises:
+            ValueError: If the response is not a JSON object
+        """
+        known_fields = [field for field in fields if field in self._field_rules]
+        if not known_fields:
+            return {}
         
-        return self.ollama_client.generate_text(prompt_config)
+        log.info("Generating %d fields in a single request...", len(known_fields))
+        response = self.ollama_client.generate_text(self._batch_prompt(context, known_fields),
+                                                    max_tokens=_BATCH_MAX_TOKENS, format=self._batch_schema(known_fields),
+                                                    no_cache=not self.enable_cache)
+        return self._parse_batch_response(response, known_fields)
+
+    async def generate_all_fields_async(self, context: str, fields: List[str]) -> Dict[str, str]:
+        """Async counterpart of generate_all_fields."""
+        known_fields = [field for field in fields if field in self._field_rules]
+        if not known_fields:
+            return {}
+        
+        log.info("Generating %d fields in a single request...", len(known_fields))
+        response = await self.ollama_client.agenerate_text(self._batch_prompt(context, known_fields),
+                                                           max_tokens=_BATCH_MAX_TOKENS, format=self._batch_schema(known_fields),
+                                                           no_cache=not self.enable_cache)
+        return self._parse_batch_response(response, known_fields)
     
-    def generate_full_issue(self, context: str, template_name: str) -> str:
+    async def generate_full_issue_async(self, context: str, template_name: str) -> str:
         """
-        Generate a complete issue from a template.
+        Generate a complete issue from a template without blocking the event loop.
+        
+        With batch_fields enabled all fields are first requested in a single JSON
+        response. Fields missing from that response (or all of them, if it cannot
+        be parsed) are requested from Ollama concurrently, one request per field.
+        
+        The async clients of the OllamaClient stay open, so several issues can be
+        generated concurrently; close them with its aclose() or 'async with'.
         
         Args:
             context: User-provided context for the issue
@@ -116,23 +425,186 @@ class IssueGenerator:
         Returns:
             Fully rendered issue content
         """
-        # Load the template
+        # Load the template and extract its fields
         template_content = self.template_manager.load_template(template_name)
-        
-        # Extract fields from the template
         fields = self._extract_template_fields(template_content)
         
-        # Generate content for each field
+        # Fields that need no request are filled in right away
         issue_data = {}
-        
-        # Generate standard fields first
         for field in fields:
-            print(f"\033[94mGenerating {field}...\033[0m")
+            answer = self._known_answer(context, field)
+            if answer is not None:
+                issue_data[field] = answer
+        
+        if self.batch_fields:
             try:
-                issue_data[field] = self.generate_issue_content(context, field)
-            except ValueError as e:
-                print(f"\033[93mWarning: Could not generate content for {field}: {str(e)}\033[0m")
+                issue_data.update(await self.generate_all_fields_async(
+                    context, [field for field in fields if field not in issue_data]))
+            except Exception as e:
+                # Unparseable answers as well as Ollama errors, e.g. a timeout of
+                # this longest request: the shorter per-field requests may succeed
+                log.warning("Warning: Falling back to per-field generation: %s", e)
+        
+        # Generate the remaining fields concurrently. Requests beyond the parallel
+        # limit queue up, so start the slowest types first to finish sooner overall.
+        # Fields of the same type share a prompt prefix, so they are also sent next
+        # to each other to help Ollama reuse its prompt cache (sorted() is stable,
+        # template order is kept per type).
+        remaining = sorted((field for field in fields if field not in issue_data),
+                           key=self._field_order)
+        
+        # Fields with identical instructions, token limit and response format
+        # need identical requests, so send each request once
+        requests = {}
+        for field in remaining:
+            requests.setdefault(self._request_key(field), field)
+        
+        capacity = self.ollama_client.max_concurrency * len(self.ollama_client.hosts)
+        if len(requests) > capacity:
+            log.warning("Warning: %d fields but only %d parallel requests; "
+                        "export a larger OLLAMA_NUM_PARALLEL before starting the Ollama server",
+                        len(requests), capacity)
+        # Exceptions are returned in place of the result so one failing field
+        # does not cancel the others
+        results = await asyncio.gather(
+            *[self.generate_issue_content_async(context, field) for field in requests.values()],
+            return_exceptions=True
+        )
+        
+        results_by_key = dict(zip(requests, results))
+        for field in remaining:
+            result = results_by_key[self._request_key(field)]
+            if isinstance(result, ValueError):
+                log.warning("Warning: Could not generate content for %s: %s", field, result)
                 issue_data[field] = f"<!-- Missing content for {field} -->"
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                issue_data[field] = result
         
         # Render the template with the generated content
         return self.template_manager.render_template(template_content, issue_data)
+    
+    async def generate_full_issues_async(self, context: str, template_names: List[str]) -> List[str]:
+        """
+        Generate issues from several templates at once, sharing the client's connections.
+        
+        The requests of all templates go through the same per-host limits, so the
+        server is kept busy without being sent more than it decodes in parallel.
+        Like generate_full_issue_async, the async clients are left open.
+        
+        Args:
+            context: User-provided context for the issues
+            template_names: Names of the template files to use
+            
+        Returns:
+            Fully rendered issue contents, in the order of template_names
+        """
+        return list(await asyncio.gather(
+            *[self.generate_full_issue_async(context, template_name) for template_name in template_names]
+        ))
+    
+    def generate_full_issue(self, context: str, template_name: str) -> str:
+        """
+        Generate a complete issue from a template.
+        
+        Blocking wrapper around generate_full_issue_async.
+        
+        Args:
+            context: User-provided context for the issue
+            template_name: Name of the template file to use
+            
+        Returns:
+            Fully rendered issue content
+        """
+        async def run():
+            try:
+                return await self.generate_full_issue_async(context, template_name)
+            finally:
+                # The async clients belong to the event loop asyncio.run closes
+                await self.ollama_client.aclose()
+        
+        return asyncio.run(run())
+
+    def generate_full_issues(self, context: str, template_names: List[str]) -> List[str]:
+        """
+        Generate issues from several templates at once.
+        
+        Blocking wrapper around generate_full_issues_async.
+        
+        Args:
+            context: User-provided context for the issues
+            template_names: Names of the template files to use
+            
+        Returns:
+            Fully rendered issue contents, in the order of template_names
+        """
+        async def run():
+            try:
+                return await self.generate_full_issues_async(context, template_names)
+            finally:
+                await self.ollama_client.aclose()
+        
+        return asyncio.run(run())
+
+    def generate_full_issue_stream(self, context: str, template_name: str) -> Iterator[str]:
+        """
+        Generate a complete issue from a template, yielding it as it is produced.
+        
+        Fields are generated one after another and their text is yielded while
+        Ollama streams it, interleaved with the literal template text. This
+        assumes placeholder-only templates, which all bundled templates are.
+        
+        Args:
+            context: User-provided context for the issue
+            template_name: Name of the template file to use
+            
+        Yields:
+            Chunks of the rendered issue content
+        """
+        template_content = self.template_manager.load_template(template_name)
+        # Jinja drops a single trailing newline of a template when rendering
+        if template_content.endswith("\n"):
+            template_content = template_content[:-1]
+        
+        # Splitting on the placeholder pattern alternates literal text and field names
+        parts = _FIELD_RE.split(template_content)
+        issue_data = {}
+        for index, part in enumerate(parts):
+            if index % 2 == 0:
+                yield part
+            elif part in issue_data:
+                yield issue_data[part]
+            else:
+                answer = self._known_answer(context, part)
+                if answer is not None:
+                    issue_data[part] = answer
+                    yield answer
+                    continue
+                
+                log.info("Generating %s...", part)
+                try:
+                    prompt = self._field_prompt(context, part)
+                except ValueError as e:
+                    log.warning("Warning: Could not generate content for %s: %s", part, e)
+                    issue_data[part] = f"<!-- Missing content for {part} -->"
+                    yield issue_data[part]
+                    continue
+                
+                if part in self._field_formats:
+                    # Constrained answers are JSON, which only makes sense complete
+                    issue_data[part] = self.generate_issue_content(context, part)
+                    yield issue_data[part]
+                    continue
+                
+                chunks = []
+                max_tokens = self._field_max_tokens.get(part, _DEFAULT_MAX_TOKENS)
+                for chunk in self.ollama_client.generate_text_stream(prompt, max_tokens=max_tokens):
+                    chunks.append(chunk)
+                    yield chunk
+                # Nothing was yielded yet, so the field can still be requested again
+                if self._capped_out(part, "".join(chunks)):
+                    for chunk in self.ollama_client.generate_text_stream(prompt, max_tokens=_DEFAULT_MAX_TOKENS):
+                        chunks.append(chunk)
+                        yield chunk
+                issue_data[part] = "".join(chunks)
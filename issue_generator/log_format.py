@@ -0,0 +1,64 @@
+"""
+Colored log output for the command line.
+"""
+
+import logging
+import sys
+
+# ANSI colors used for terminal output
+GREY = "\033[90m"
+RED = "\033[91m"
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+RESET = "\033[0m"
+
+
+class ColorFormatter(logging.Formatter):
+    """Formats log records, coloring them by level when writing to a terminal."""
+
+    LEVEL_COLORS = {
+        logging.DEBUG: GREY,
+        logging.INFO: BLUE,
+        logging.WARNING: YELLOW,
+        logging.ERROR: RED,
+        logging.CRITICAL: RED,
+    }
+
+    def __init__(self, fmt: str = "%(message)s", stream=None):
+        """
+        Initialize the ColorFormatter.
+
+        Args:
+            fmt: Log record format string
+            stream: Stream the records are written to (default: stderr)
+        """
+        super().__init__(fmt)
+        stream = stream if stream is not None else sys.stderr
+        self.use_color = hasattr(stream, "isatty") and stream.isatty()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, wrapping it in its color for terminals."""
+        message = super().format(record)
+        if not self.use_color:
+            return message
+
+        # Records can pass extra={"color": ...} to override their level color
+        color = getattr(record, "color", self.LEVEL_COLORS.get(record.levelno, ""))
+        return f"{color}{message}{RESET}"
+
+
+def setup_logging(level: int = logging.INFO):
+    """
+    Send log records to stderr, colored when stderr is a terminal.
+
+    Args:
+        level: Minimum level of the records of this package to show (default: INFO)
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(ColorFormatter(stream=handler.stream))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+    # Only this package's level changes, debug output of other libraries stays hidden
+    logging.getLogger("issue_generator").setLevel(level)
+    # The ollama SDK's HTTP client logs every request at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -2,16 +2,113 @@
 Client for interacting with the Ollama API for text generation.
 """
 
+import asyncio
+import hashlib
+import httpx
+import itertools
+import json
+import logging
+import os
 import time
 import ollama
 import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Union
+from .log_format import GREEN
+
+log = logging.getLogger(__name__)
+
+
+# Number of responses kept by the in-process response cache
+_RESPONSE_CACHE_SIZE = 512
+
+# Above this temperature a request asks for a new sample, so it is not cached
+_CACHE_MAX_TEMPERATURE = 0.3
+
+# Errors after which a request is sent again: the SDK raises ConnectionError
+# when a server cannot be reached, timeouts come straight from httpx
+_RETRYABLE_ERRORS = (httpx.TimeoutException, ConnectionError)
+
+# Patterns used to clean thinking output from responses
+_THINK_BLOCK_RE = re.compile(r'<think>(.*?)</think>', re.DOTALL | re.IGNORECASE)
+_THINK_TAG_RE = re.compile(r'</?think>', re.IGNORECASE)
+_THINK_OPEN_RE = re.compile(r'<think>', re.IGNORECASE)
+_THINK_CLOSE_RE = re.compile(r'</think>', re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Characters at the end of streamed text that may start a thinking tag
+# completed by the next chunk: one less than the longest tag
+_TAG_TAIL = len('</think>') - 1
+
+
+def _tag_tail_start(text: str) -> int:
+    """Return where the part of streamed text that may start a thinking tag begins."""
+    position = text.find('<', max(0, len(text) - _TAG_TAIL))
+    return len(text) if position == -1 else position
+
+
+def _strip_think_blocks(chunks: Iterator[str]) -> Iterator[str]:
+    """Streaming version of _THINK_BLOCK_RE.sub('', text): drop complete thinking blocks."""
+    buffer = ""
+    in_block = False
+    # Where the search for the closing tag continues; earlier text was searched before
+    search_from = 0
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if not in_block:
+                match = _THINK_OPEN_RE.search(buffer)
+                if match is None:
+                    split_at = _tag_tail_start(buffer)
+                    if split_at:
+                        yield buffer[:split_at]
+                    buffer = buffer[split_at:]
+                    break
+                if match.start():
+                    yield buffer[:match.start()]
+                # Keep the block until it closes; an unclosed block stays as text
+                buffer = buffer[match.start():]
+                in_block = True
+                search_from = match.end() - match.start()
+            else:
+                match = _THINK_CLOSE_RE.search(buffer, search_from)
+                if match is None:
+                    search_from = max(search_from, len(buffer) - _TAG_TAIL)
+                    break
+                buffer = buffer[match.end():]
+                in_block = False
+    if buffer:
+        yield buffer
+
+
+def _strip_think_tags(chunks: Iterator[str]) -> Iterator[str]:
+    """Streaming version of _THINK_TAG_RE.sub('', text): drop stray thinking tags."""
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        pieces = []
+        position = 0
+        for match in _THINK_TAG_RE.finditer(buffer):
+            pieces.append(buffer[position:match.start()])
+            position = match.end()
+        rest = buffer[position:]
+        split_at = _tag_tail_start(rest)
+        pieces.append(rest[:split_at])
+        buffer = rest[split_at:]
+        text = "".join(pieces)
+        if text:
+            yield text
+    if buffer:
+        yield buffer
 
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
     
     def __init__(self, base_url: str = "http://localhost:11434", model: str = "gemma3:12b", 
-                 system_prompt: str = "You are a helpful AI assistant.", quality: str = None):
+                 system_prompt: str = "You are a helpful AI assistant.", quality: str = None,
+                 hosts: List[str] = None, request_timeout: float = None, max_retries: int = 2,
+                 num_ctx: int = None, num_batch: int = None, keep_alive: Union[str, int] = None):
         """
         Initialize the Ollama client.
         
@@ -20,17 +117,57 @@ class OllamaClient:
             model: Ollama model to use
             system_prompt: The system prompt to guide the AI model
             quality: Quality setting for models that support it (e.g., 'high', 'medium', 'low' for gpt-oss:latest)
+            hosts: Base URLs of several Ollama servers to spread requests over
+                round-robin (optional, overrides base_url)
+            request_timeout: Seconds to wait for Ollama to send data before giving
+                up on a request (default: wait indefinitely)
+            max_retries: How often a request that timed out or could not connect
+                is sent again, to the next host if there are several
+            num_ctx: Context window size in tokens (default: the server's setting).
+                Ollama reloads the model when it changes, so it is fixed per client
+            num_batch: Number of prompt tokens processed per step during prefill
+                (default: the server's setting). Like num_ctx it is fixed per client
+            keep_alive: How long Ollama keeps the model loaded after a request,
+                e.g. '30m', or seconds with -1 for always (default: the server's setting)
         """
-        self.base_url = base_url
+        self.hosts = list(hosts) if hosts else [base_url]
+        self.base_url = self.hosts[0]
         self.model = model
         self.system_prompt = system_prompt
         self.quality = quality
-        self.ollama_sdk_client = ollama.Client(host=self.base_url)
+        self.num_ctx = num_ctx
+        self.num_batch = num_batch
+        self.keep_alive = keep_alive
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        # One SDK client (and so one pooled HTTP connection) per host for all requests
+        self.ollama_sdk_clients = {host: ollama.Client(host=host, timeout=request_timeout) for host in self.hosts}
+        self.ollama_sdk_client = self.ollama_sdk_clients[self.base_url]
+        self._ollama_async_clients = {}
+        self._host_cycle = itertools.cycle(self.hosts)
+        # Match the number of requests the server decodes in parallel; more in
+        # flight only queue up server-side or split its context window
+        self.max_concurrency = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+        self._semaphores = {}
+        self._response_cache = OrderedDict()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
     def generate_text(self, prompt: str, max_tokens: int = 2048, 
                       temperature: float = 0.1, top_p: float = 0.1, 
                       top_k: int = 20, presence_penalty: float = 0.1,
-                      frequency_penalty: float = 0.1) -> str:
+                      frequency_penalty: float = 0.1, format: Union[str, Dict[str, Any]] = None,
+                      no_cache: bool = False) -> str:
         """
         Generate text using Ollama.
         
@@ -42,6 +179,9 @@ class OllamaClient:
             top_k: Limits token selection to k most likely tokens
             presence_penalty: Penalizes repeated tokens (0.0-1.0)
             frequency_penalty: Penalizes frequent tokens (0.0-1.0)
+            format: Response format to enforce: 'json' or a JSON schema (optional)
+            no_cache: Always ask Ollama, even if an identical request was answered before.
+                Requests with a temperature above 0.3 are never answered from the cache
             
         Returns:
             Generated text as a string
@@ -51,135 +191,409 @@ class OllamaClient:
         """
         try:
             # Start timing
-            start_time = time.time()
-            
-            # Clean up prompt by removing newlines and excessive spaces
-            cleaned_prompt = " ".join(prompt.replace("\n", " ").split())
-            
-            # Prepare generation parameters
-            options = {
-                "num_predict": max_tokens,
-                "temperature": temperature,
-                "top_p": top_p,
-                "top_k": top_k,
-                "presence_penalty": presence_penalty,
-                "frequency_penalty": frequency_penalty,
-            }
+            start_time = time.perf_counter()
             
-            # Add quality parameter if specified (for models like gpt-oss:latest)
-            if self.quality:
-                options["quality"] = self.quality
+            params = self._build_params(prompt, max_tokens, temperature, top_p, top_k,
+                                        presence_penalty, frequency_penalty, format)
             
-            params = {
-                "model": self.model,
-                "prompt": cleaned_prompt,
-                "system": self.system_prompt,
-                "options": options
-            }
+            cache_key = self._cache_key(params)
+            cacheable = temperature <= _CACHE_MAX_TEMPERATURE
+            if cacheable and not no_cache and cache_key in self._response_cache:
+                return self._cached_response(cache_key)
+            
+            # The complete text is needed anyway, so a single response is enough
+            result = self._process_generation(params)
+            
+            text = self._finish_generation(start_time, result)
+            return self._cache_response(cache_key, text) if cacheable else text
+        except Exception as e:
+            # Timeouts carry no message of their own
+            message = str(e) or type(e).__name__
+            log.error("Error: %s", message)
+            raise Exception(f"Error generating text with Ollama: {message}")
+    
+    async def agenerate_text(self, prompt: str, max_tokens: int = 2048, 
+                             temperature: float = 0.1, top_p: float = 0.1, 
+                             top_k: int = 20, presence_penalty: float = 0.1,
+                             frequency_penalty: float = 0.1, format: Union[str, Dict[str, Any]] = None,
+                             no_cache: bool = False) -> str:
+        """
+        Generate text using Ollama without blocking the event loop.
+        
+        Takes the same arguments as generate_text. Several calls can be awaited
+        concurrently; how many the server actually decodes in parallel is bounded
+        by its OLLAMA_NUM_PARALLEL setting.
+        
+        Returns:
+            Generated text as a string
             
-            # Using ollama library for streaming generation
-            result = self._process_streaming_generation(params)
+        Raises:
+            Exception: If there's an error communicating with Ollama
+        """
+        try:
+            start_time = time.perf_counter()
             
-            # Log metrics
-            self._log_metrics(
-                start_time=start_time,
-                end_time=time.time(),
-                first_token_time=result["first_token_time"],
-                token_times=result["token_times"],
-                total_prompt_tokens=result["total_prompt_tokens"],
-                total_completion_tokens=result["total_completion_tokens"]
-            )
+            params = self._build_params(prompt, max_tokens, temperature, top_p, top_k,
+                                        presence_penalty, frequency_penalty, format)
             
-            # Print success message in green
-            print("\033[92mGeneration completed successfully\033[0m")
+            cache_key = self._cache_key(params)
+            cacheable = temperature <= _CACHE_MAX_TEMPERATURE
+            if cacheable and not no_cache and cache_key in self._response_cache:
+                return self._cached_response(cache_key)
             
-            # Clean the response to remove any thinking tags
-            cleaned_text = self._clean_response(result["text"])
+            result = await self._aprocess_generation(params)
             
-            return cleaned_text
+            text = self._finish_generation(start_time, result)
+            return self._cache_response(cache_key, text) if cacheable else text
         except Exception as e:
-            # Print error in red
-            print(f"\033[91mError: {str(e)}\033[0m")
-            raise Exception(f"Error generating text with Ollama: {str(e)}")
-    
-    def _process_streaming_generation(self, params):
-        """Process the streaming generation using ollama library."""
-        generated_text = ""
-        total_prompt_tokens = 0
-        total_completion_tokens = 0
-        first_token_time = None
-        token_times = []
-        
-        # Use the instance's ollama.Client to get streaming response
-        for chunk in self.ollama_sdk_client.generate(**params, stream=True):
-            current_time = time.time()
+            # Timeouts carry no message of their own
+            message = str(e) or type(e).__name__
+            log.error("Error: %s", message)
+            raise Exception(f"Error generating text with Ollama: {message}")
+    
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate text for several prompts concurrently.
+        
+        Blocking wrapper around agenerate_batch for callers without an event loop.
+        
+        Args:
+            prompts: Text prompts to feed to the model
+            **kwargs: Generation arguments passed to agenerate_text for every prompt
+        
+        Returns:
+            Generated texts, in the order of the prompts
+        """
+        async def run():
+            try:
+                return await self.agenerate_batch(prompts, **kwargs)
+            finally:
+                # The async clients belong to the event loop asyncio.run closes
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def agenerate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate text for several prompts concurrently.
+        
+        Args:
+            prompts: Text prompts to feed to the model
+            **kwargs: Generation arguments passed to agenerate_text for every prompt
+        
+        Returns:
+            Generated texts, in the order of the prompts
+        """
+        return list(await asyncio.gather(*(self.agenerate_text(prompt, **kwargs) for prompt in prompts)))
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 2048, 
+                             temperature: float = 0.1, top_p: float = 0.1, 
+                             top_k: int = 20, presence_penalty: float = 0.1,
+                             frequency_penalty: float = 0.1) -> Iterator[str]:
+        """
+        Generate text using Ollama, yielding it as it arrives.
+        
+        Takes the same arguments as generate_text. Thinking blocks and leading or
+        trailing whitespace are dropped on the fly, like generate_text does for
+        the complete response.
+        
+        Yields:
+            Chunks of generated text
+            
+        Raises:
+            Exception: If there's an error communicating with Ollama
+        """
+        try:
+            start_time = time.perf_counter()
+            
+            params = self._build_params(prompt, max_tokens, temperature, top_p, top_k,
+                                        presence_penalty, frequency_penalty)
             
+            metrics = {
+                "total_prompt_tokens": 0,
+                "total_completion_tokens": 0,
+                "generation_time": None
+            }
+            yield from self._clean_stream(self._stream_chunks(params, metrics))
+            
+            self._log_metrics(start_time=start_time, end_time=time.perf_counter(), **metrics)
+            log.info("Generation completed successfully", extra={"color": GREEN})
+        except Exception as e:
+            # Timeouts carry no message of their own
+            message = str(e) or type(e).__name__
+            log.error("Error: %s", message)
+            raise Exception(f"Error generating text with Ollama: {message}")
+    
+    def close(self):
+        """Close the pooled connections to Ollama."""
+        for client in self.ollama_sdk_clients.values():
+            client.close()
+    
+    async def aclose(self):
+        """
+        Close the async clients; new ones are created on the next async call.
+        
+        Only call this once no async request is in flight, e.g. through
+        'async with OllamaClient(...)'; the sync wrappers do it for their own loop.
+        """
+        for client in self._ollama_async_clients.values():
+            await client.close()
+        self._ollama_async_clients = {}
+        self._semaphores = {}
+    
+    def _next_host(self) -> str:
+        """Pick the host for the next request, cycling through all hosts."""
+        return next(self._host_cycle)
+    
+    def _retry_host(self, failed_host: str) -> str:
+        """Pick the host for a retry, avoiding the one that just failed if there are others."""
+        host = self._next_host()
+        if host == failed_host and len(self.hosts) > 1:
+            host = self._next_host()
+        return host
+    
+    def _build_params(self, prompt, max_tokens, temperature, top_p, top_k,
+                      presence_penalty, frequency_penalty, format=None):
+        """Build the request parameters for an Ollama generate call."""
+        # Clean up prompt by removing newlines and excessive spaces
+        cleaned_prompt = " ".join(prompt.replace("\n", " ").split())
+        
+        # Prepare generation parameters
+        options = {
+            "num_predict": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "presence_penalty": presence_penalty,
+            "frequency_penalty": frequency_penalty,
+        }
+        
+        # Add quality parameter if specified (for models like gpt-oss:latest)
+        if self.quality:
+            options["quality"] = self.quality
+        
+        if self.num_ctx:
+            options["num_ctx"] = self.num_ctx
+        
+        if self.num_batch:
+            options["num_batch"] = self.num_batch
+        
+        params = {
+            "model": self.model,
+            "prompt": cleaned_prompt,
+            "system": self.system_prompt,
+            "options": options
+        }
+        
+        if format:
+            params["format"] = format
+        
+        if self.keep_alive is not None:
+            params["keep_alive"] = self.keep_alive
+        
+        return params
+    
+    def clear_cache(self):
+        """Forget all cached responses."""
+        self._response_cache.clear()
+    
+    def _cache_key(self, params):
+        """Key identifying a request: model, system prompt, prompt and all options."""
+        # A digest keeps the cache small compared to storing every prompt as key
+        return hashlib.blake2b(json.dumps(params, sort_keys=True).encode(), digest_size=16).digest()
+    
+    def _cached_response(self, cache_key):
+        """Return a cached response and mark it as recently used."""
+        self._response_cache.move_to_end(cache_key)
+        log.info("Using cached response", extra={"color": GREEN})
+        return self._response_cache[cache_key]
+    
+    def _cache_response(self, cache_key, text):
+        """Store a response, evicting the least recently used one when full."""
+        self._response_cache[cache_key] = text
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return text
+    
+    def _finish_generation(self, start_time, result):
+        """Log metrics for a finished generation and return the cleaned text."""
+        # Log metrics
+        self._log_metrics(
+            start_time=start_time,
+            end_time=time.perf_counter(),
+            generation_time=result["generation_time"],
+            total_prompt_tokens=result["total_prompt_tokens"],
+            total_completion_tokens=result["total_completion_tokens"]
+        )
+        
+        log.info("Generation completed successfully", extra={"color": GREEN})
+        
+        # Clean the response to remove any thinking tags
+        return self._clean_response(result["text"])
+    
+    def _process_generation(self, params):
+        """Request a complete (non-streamed) response using ollama library."""
+        host = self._next_host()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.ollama_sdk_clients[host].generate(**params)
+                return self._generation_result(response)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                log.warning("Warning: Retrying request to Ollama: %s", str(e) or type(e).__name__)
+                host = self._retry_host(host)
+    
+    def _stream_chunks(self, params, metrics):
+        """Yield response chunks from ollama, storing the final metrics in metrics."""
+        for chunk in self.ollama_sdk_clients[self._next_host()].generate(**params, stream=True):
             if 'response' in chunk:
-                if first_token_time is None:
-                    first_token_time = current_time
-                
-                generated_text += chunk['response']
-                token_times.append(current_time)
+                yield chunk['response']
             
-            # Extract token counts if available
-            if 'prompt_eval_count' in chunk:
-                total_prompt_tokens = chunk['prompt_eval_count']
-            if 'eval_count' in chunk:
-                total_completion_tokens = chunk['eval_count']
+            # The last chunk carries the token counts and timings of the whole generation
+            if chunk.get('done'):
+                metrics.update(self._generation_metrics(chunk))
+    
+    async def _aprocess_generation(self, params):
+        """Request a complete (non-streamed) response using the async ollama client."""
+        host = self._next_host()
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._arequest(host, params)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                log.warning("Warning: Retrying request to Ollama: %s", str(e) or type(e).__name__)
+                host = self._retry_host(host)
+    
+    async def _arequest(self, host, params):
+        """Send a request to a host, waiting for a free slot on that host."""
+        # Client and semaphore are created lazily so they bind to the running event loop
+        if host not in self._ollama_async_clients:
+            # One kept-alive connection per request slot, reused by every field of the run
+            limits = httpx.Limits(max_connections=self.max_concurrency,
+                                  max_keepalive_connections=self.max_concurrency)
+            self._ollama_async_clients[host] = ollama.AsyncClient(host=host, timeout=self.request_timeout,
+                                                                  limits=limits)
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
         
+        client, semaphore = self._ollama_async_clients[host], self._semaphores[host]
+        
+        async with semaphore:
+            response = await client.generate(**params)
+        return self._generation_result(response)
+    
+    def _generation_result(self, response):
+        """Extract the text and the server-reported metrics from a complete response."""
+        return {"text": (response.get('response') or "").strip(), **self._generation_metrics(response)}
+    
+    def _generation_metrics(self, response):
+        """Extract the token counts and decode time reported by Ollama."""
+        eval_duration = response.get('eval_duration')
         return {
-            "text": generated_text.strip(),
-            "total_prompt_tokens": total_prompt_tokens,
-            "total_completion_tokens": total_completion_tokens,
-            "first_token_time": first_token_time,
-            "token_times": token_times
+            "total_prompt_tokens": response.get('prompt_eval_count') or 0,
+            "total_completion_tokens": response.get('eval_count') or 0,
+            # Ollama reports durations in nanoseconds
+            "generation_time": eval_duration / 1e9 if eval_duration else None
         }
     
-    def _log_metrics(self, start_time, end_time, first_token_time, token_times, 
+    def _log_metrics(self, start_time, end_time, generation_time, 
                      total_prompt_tokens, total_completion_tokens):
-        """Log performance metrics for the generation process."""
+        """Log performance metrics for the generation process at debug level."""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+        
         # Calculate token timing metrics
         tokens_per_second = None
-        if first_token_time and token_times:
-            generation_time = token_times[-1] - first_token_time if len(token_times) > 1 else 0.001
-            
-            if generation_time > 0.05 and total_completion_tokens > 0:
-                tokens_per_second = total_completion_tokens / generation_time
+        if generation_time and generation_time > 0.05 and total_completion_tokens > 0:
+            tokens_per_second = total_completion_tokens / generation_time
         
         total_time = end_time - start_time
         
-        # Print metrics with muted color
-        print("\n\t\033[90m--- LLM Request Metrics ---")
-        print(f"\tPrompt tokens: {total_prompt_tokens}")
-        print(f"\tCompletion tokens: {total_completion_tokens}")
-        print(f"\tTotal time: {total_time:.3f}s")
-        if tokens_per_second is not None:
-            print(f"\tSpeed: {tokens_per_second:.2f} tokens/second")
-        else:
-            print("\tSpeed: N/A tokens/second")
-        print("\t---------------------------\033[0m\n")
+        speed = f"{tokens_per_second:.2f}" if tokens_per_second is not None else "N/A"
+        
+        # Log the whole block as one record
+        log.debug("\n\t--- LLM Request Metrics ---\n"
+                 "\tPrompt tokens: %s\n"
+                 "\tCompletion tokens: %s\n"
+                 "\tTotal time: %.3fs\n"
+                 "\tSpeed: %s tokens/second\n"
+                 "\t---------------------------\n",
+                 total_prompt_tokens, total_completion_tokens, total_time, speed)
     
     def _clean_response(self, text: str) -> str:
         """Remove thinking tags and other unwanted elements from the response."""
         original_text = text
         
-        # Remove <think>...</think> tags and their content
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove any standalone <think> or </think> tags
-        text = re.sub(r'</?think>', '', text, flags=re.IGNORECASE)
+        # Most models never emit thinking tags; any tag needs a '<', whatever its case
+        if '<' in text:
+            start, end = text.find('<think>'), text.find('</think>')
+            if text.count('<') == 2 and 0 <= start < end:
+                # A single lowercase block and no other tag: cut it out without the regex
+                text = text[:start] + text[end + len('</think>'):]
+            else:
+                # Remove <think>...</think> tags and their content
+                text = _THINK_BLOCK_RE.sub('', text)
+                
+                # Remove any standalone <think> or </think> tags
+                text = _THINK_TAG_RE.sub('', text)
         
         # Clean up any extra whitespace that might be left
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # Replace multiple newlines with double newlines
+        text = _BLANK_LINES_RE.sub('\n\n', text)  # Replace multiple newlines with double newlines
         text = text.strip()
         
         # Fallback: if cleaning removed everything (model put answer inside think tags),
         # extract the last sentence/paragraph from the think block as the actual answer
-        if not text and original_text.strip():
-            think_content = re.search(r'<think>(.*?)</think>', original_text, flags=re.DOTALL | re.IGNORECASE)
-            if think_content:
-                # Take only the last non-empty paragraph — that's typically the final answer
-                paragraphs = [p.strip() for p in think_content.group(1).split('\n') if p.strip()]
-                text = paragraphs[-1] if paragraphs else original_text.strip()
+        if not text:
+            text = self._think_fallback(original_text)
         
         return text
+    
+    def _think_fallback(self, original_text: str) -> str:
+        """Return the answer of a response that consisted only of thinking, if any."""
+        if not original_text.strip():
+            return ""
+        think_content = _THINK_BLOCK_RE.search(original_text)
+        if not think_content:
+            return ""
+        # Take only the last non-empty paragraph — that's typically the final answer
+        paragraphs = [p.strip() for p in think_content.group(1).split('\n') if p.strip()]
+        return paragraphs[-1] if paragraphs else original_text.strip()
+    
+    def _clean_stream(self, chunks: Iterator[str]) -> Iterator[str]:
+        """
+        Streaming counterpart of _clean_response for chunked output.
+        
+        Joined, the yielded text equals what _clean_response returns for the joined
+        chunks: the same passes run one after another on the stream, each holding
+        back only the text the next chunk could still change.
+        """
+        # The raw response is only needed for the fallback, so until text is yielded
+        raw = []
+        started = False
+        pending_whitespace = ""
+        
+        def record(chunks):
+            for chunk in chunks:
+                if not started:
+                    raw.append(chunk)
+                yield chunk
+        
+        for text in _strip_think_tags(_strip_think_blocks(record(chunks))):
+            # Trailing whitespace waits for more text: at the end it is stripped
+            text = pending_whitespace + text
+            if not started:
+                text = text.lstrip()
+            body = text.rstrip()
+            pending_whitespace = text[len(body):]
+            if body:
+                started = True
+                raw.clear()
+                # Every whitespace run in body is complete, so it collapses as a whole
+                yield _BLANK_LINES_RE.sub('\n\n', body)
+        
+        if not started:
+            answer = self._think_fallback("".join(raw))
+            if answer:
+                yield answer
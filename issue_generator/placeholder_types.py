@@ -2,17 +2,90 @@
 Placeholder type generators for different content generation strategies.
 """
 
-from typing import List
+from typing import List, Optional, Sequence
 from .ollama_client import OllamaClient
 
 
+# Instructions per placeholder type, completed with str.format
+_HEADER_RULES = """
+Create a brief, concise title.
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- Maximum {word_limit} words.
+- Return without any additional text or punctuations.
+"""
+
+_SENTENCE_RULES = """
+Write clear and descriptive sentence(s) about the topic.
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- The sentence should be functional and direct.
+- Maximum {word_limit} words.
+- Return without any explanation, additional text or newline characters.
+"""
+
+_BULLETS_RULES = """
+Create a list of bullet points.
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- Maximum {bullet_limit} bullet points.
+- "Bullet format: '* <bullet_item>'."
+- Return without any explanation, additional text or special characters beyond the bullet format.
+"""
+
+_NUMBERED_RULES = """
+Create a list of sequential steps or items.
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- Maximum {step_limit} numbered items.
+- Each step should be clear and actionable.
+- Don't use number to sequence steps, but this format: {number_format}.
+- Return without any explanation, additional text or special characters beyond the number format.
+"""
+
+_SELECTION_RULES = """
+Select ONE option from the provided list.
+
+Available options: {options}
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- Return ONLY the selected option.
+- Remove the information between brackets.
+- Return without any explanation or additional text.
+"""
+
+_TABLES_RULES = """
+Create one or more tables based on the context.
+
+Additional information that overrules the rules if contradicting: {additional_info}
+
+Rules:
+- Generate {table_limit} table(s).
+- Table text is in Dutch.
+- {title_format_rule}
+- {header_format_rule}
+- {row_format_rule}
+- Return only the title and table output, no extra text, newlines or code blocks.
+"""
+
+
 class PlaceholderTypes:
     """Handles different types of content generation for template placeholders."""
-    
+
     def __init__(self, ollama_client: OllamaClient, output_format: str = 'jira'):
         """
         Initialize the PlaceholderTypes.
-        
+
         Args:
             ollama_client: Pre-initialized client for generating text with Ollama
             output_format: The desired output format ('jira' or 'adoc')
@@ -20,96 +93,72 @@ class PlaceholderTypes:
         self.ollama_client = ollama_client
         self.output_format = output_format
 
-    def generate_header(self, context: str, word_limit: int = 7, additional_info: str = '') -> str:
+    def with_context(self, rules: str, context: str) -> str:
         """
-        Generate a concise header/title with a limited number of words.
-        
+        Complete the instructions of a placeholder type into a prompt.
+
+        The context comes first: it is the same for every field of an issue, so
+        Ollama can reuse the processed system prompt and context between requests
+        and only has to process the instructions that differ.
+
         Args:
-            context: User-provided context for the header
-            word_limit: Maximum number of words in the header (default: 7)
-            additional_info: Additional prompt information (optional)
-            
+            rules: Instructions built by one of the *_rules methods
+            context: User-provided context for the placeholder
+
         Returns:
-            Generated header as a string
+            Prompt to send to the model
         """
-        prompt = f"""
-            Create a brief, concise title.
+        return f"This is the context: {context}\n{rules}"
 
-            Additional information that overrules the rules if contradicting: {additional_info}
+    def header_rules(self, word_limit: int = 7, additional_info: str = '') -> str:
+        """
+        Build the instructions for a concise header/title with a limited number of words.
 
-            Rules:
-            - Maximum {word_limit} words.
-            - Return without any additional text or punctuations.
+        Args:
+            word_limit: Maximum number of words in the header (default: 7)
+            additional_info: Additional prompt information (optional)
 
-            This is the context: {context}
+        Returns:
+            Instructions for the header as a string
         """
-        
-        return self.ollama_client.generate_text(prompt)
+        return _HEADER_RULES.format(word_limit=word_limit, additional_info=additional_info)
 
-    def generate_sentence(self, context: str, word_limit: int = 50, additional_info: str = '') -> str:
+    def sentence_rules(self, word_limit: int = 50, additional_info: str = '') -> str:
         """
-        Generate descriptive, functional, and clear sentences.
-        
+        Build the instructions for descriptive, functional, and clear sentences.
+
         Args:
-            context: User-provided context for the sentence
             word_limit: Maximum number of words in the sentence (default: 50)
             additional_info: Additional prompt information (optional)
-            
+
         Returns:
-            Generated sentence as a string
+            Instructions for the sentence as a string
         """
-        prompt = f"""
-            Write clear and descriptive sentence(s) about the topic.
-
-            Additional information that overrules the rules if contradicting: {additional_info}
+        return _SENTENCE_RULES.format(word_limit=word_limit, additional_info=additional_info)
 
-            Rules:
-            - The sentence should be functional and direct.
-            - Maximum {word_limit} words.
-            - Return without any explanation, additional text or newline characters.
-
-            This is the context: {context}
+    def bullets_rules(self, bullet_limit: int = 5, additional_info: str = '') -> str:
         """
-        return self.ollama_client.generate_text(prompt)
+        Build the instructions for a list of bullet points.
 
-    def generate_bullets(self, context: str, bullet_limit: int = 5, additional_info: str = '') -> str:
-        """
-        Generate a list of bullet points.
-        
         Args:
-            context: User-provided context for the bullet points
             bullet_limit: Maximum number of bullet points to generate (default: 5)
             additional_info: Additional prompt information (optional)
-            
+
         Returns:
-            Generated bullet points as a string
+            Instructions for the bullet points as a string
         """
-        
-        prompt = f"""
-            Create a list of bullet points. 
-            
-            Additional information that overrules the rules if contradicting: {additional_info}
+        return _BULLETS_RULES.format(bullet_limit=bullet_limit, additional_info=additional_info)
 
-            Rules:
-            - Maximum {bullet_limit} bullet points.
-            - "Bullet format: '* <bullet_item>'."
-            - Return without any explanation, additional text or special characters beyond the bullet format.
-
-            This is the context: {context}
+    def numbered_rules(self, step_limit: int = 5, additional_info: str = '') -> str:
         """
-        return self.ollama_client.generate_text(prompt)
+        Build the instructions for a numbered list of sequential steps.
 
-    def generate_numbered(self, context: str, step_limit: int = 5, additional_info: str = '') -> str:
-        """
-        Generate a numbered list of sequential steps.
-        
         Args:
-            context: User-provided context for the numbered steps
             step_limit: Maximum number of steps to generate (default: 5)
             additional_info: Additional prompt information (optional)
-            
+
         Returns:
-            Generated numbered steps as a string
+            Instructions for the numbered steps as a string
         """
 
         # Define format-specific rules
@@ -117,66 +166,42 @@ class PlaceholderTypes:
             number_format = "'. <step_item>'."
         else: # Default to Jira
             number_format = "'# <step_item>'."
-        
-        prompt = f"""
-            Create a list of sequential steps or items. 
-            
-            Additional information that overrules the rules if contradicting: {additional_info}
 
-            Rules:
-            - Maximum {step_limit} numbered items.
-            - Each step should be clear and actionable.
-            - Don't use number to sequence steps, but this format: {number_format}.
-            - Return without any explanation, additional text or special characters beyond the number format.
+        return _NUMBERED_RULES.format(step_limit=step_limit, number_format=number_format,
+                                      additional_info=additional_info)
 
-            This is the context: {context}
+    def selection_rules(self, options: List[str], additional_info: str = '') -> str:
         """
-        return self.ollama_client.generate_text(prompt)
+        Build the instructions for selecting a single item from a predefined list.
 
-    def select_from_list(self, context: str, options: List[str], additional_info: str = '') -> str:
-        """
-        Select a single item from a predefined list based on the context.
-        
         Args:
-            context: User-provided context for the selection
             options: List of options to choose from
             additional_info: Additional prompt information (optional)
-            
+
         Returns:
-            Selected item as a string
+            Instructions for the selection as a string
         """
-        options_str = ", ".join([f"'{option}'" for option in options])
-        prompt = f"""
-            Select ONE option from the provided list.
-            
-            Available options: {options_str}
-
-            Additional information that overrules the rules if contradicting: {additional_info}
+        options_str = "'" + "', '".join(options) + "'"
+        return _SELECTION_RULES.format(options=options_str, additional_info=additional_info)
 
-            Rules:
-            - Return ONLY the selected option.
-            - Remove the information between brackets.
-            - Return without any explanation or additional text.
-            
-            This is the context: {context}
+    def tables_rules(self, table_limit: int = 1, table_title: str = 'Table: <title>', table_headers: Optional[Sequence[str]] = None, additional_info: str = '') -> str:
         """
-        return self.ollama_client.generate_text(prompt)
+        Build the instructions for tables in the specified format (Markdown or AsciiDoc).
 
-    def generate_tables(self, context: str, table_limit: int = 1, table_title: str = 'Table: <title>', table_headers: list = [], additional_info: str = '') -> str:
-        """
-        Generate tables in the specified format (Markdown or AsciiDoc).
-        
         Args:
-            context: User-provided context for the tables
             table_limit: Maximum number of tables to generate
             table_title: Title format string (e.g., "BF{n}: {title}")
-            table_headers: List of header strings
+            table_headers: Header strings (default: ("Steps", "Description"))
             additional_info: Additional prompt information (optional)
-            
+
         Returns:
-            Generated tables as a structured string in the correct format.
+            Instructions for the tables as a string
         """
-        
+        if table_headers is None:
+            table_headers = ("Steps", "Description")
+        # Shown as a list in the prompt, whichever sequence type was passed
+        table_headers = list(table_headers)
+
         # Define format-specific rules
         if self.output_format == 'adoc':
             title_format_rule = f"Table title format: '===== {{title}}' (e.g., '===== {table_title}'). If title is empty, omit this line. Include the attribute line '[cols=\"1,9\",options=\"header\"]' directly below the title and before the table start."
@@ -187,20 +212,30 @@ class PlaceholderTypes:
             header_format_rule = f"Table headers are: {table_headers} in the format '||header1||header2||...||'."
             row_format_rule = "Table rows are in the format '|row1|row2|...|'."
 
-        prompt = f"""
-            Create one or more tables based on the context.
+        return _TABLES_RULES.format(table_limit=table_limit, title_format_rule=title_format_rule,
+                                    header_format_rule=header_format_rule, row_format_rule=row_format_rule,
+                                    additional_info=additional_info)
+
+    def generate_header(self, context: str, word_limit: int = 7, additional_info: str = '') -> str:
+        """Generate a concise header/title with a limited number of words."""
+        return self.ollama_client.generate_text(self.with_context(self.header_rules(word_limit, additional_info), context))
 
-            Additional information that overrules the rules if contradicting: {additional_info}
+    def generate_sentence(self, context: str, word_limit: int = 50, additional_info: str = '') -> str:
+        """Generate descriptive, functional, and clear sentences."""
+        return self.ollama_client.generate_text(self.with_context(self.sentence_rules(word_limit, additional_info), context))
 
-            Rules:
-            - Generate {table_limit} table(s).
-            - Table text is in Dutch.
-            - {title_format_rule}
-            - {header_format_rule}
-            - {row_format_rule}
-            - Return only the title and table output, no extra text, newlines or code blocks.
+    def generate_bullets(self, context: str, bullet_limit: int = 5, additional_info: str = '') -> str:
+        """Generate a list of bullet points."""
+        return self.ollama_client.generate_text(self.with_context(self.bullets_rules(bullet_limit, additional_info), context))
 
-            This is the context: {context}
-        """
-        
-        return self.ollama_client.generate_text(prompt)
+    def generate_numbered(self, context: str, step_limit: int = 5, additional_info: str = '') -> str:
+        """Generate a numbered list of sequential steps."""
+        return self.ollama_client.generate_text(self.with_context(self.numbered_rules(step_limit, additional_info), context))
+
+    def select_from_list(self, context: str, options: List[str], additional_info: str = '') -> str:
+        """Select a single item from a predefined list based on the context."""
+        return self.ollama_client.generate_text(self.with_context(self.selection_rules(options, additional_info), context))
+
+    def generate_tables(self, context: str, table_limit: int = 1, table_title: str = 'Table: <title>', table_headers: Optional[Sequence[str]] = None, additional_info: str = '') -> str:
+        """Generate tables in the specified format (Markdown or AsciiDoc)."""
+        return self.ollama_client.generate_text(self.with_context(self.tables_rules(table_limit, table_title, table_headers, additional_info), context))
@@ -2,22 +2,64 @@
 Template manager for loading and rendering templates and managing prompt configurations.
 """
 
+import copy
 import os
 import json
+from functools import lru_cache
 from typing import Dict, Any
 from jinja2 import Template
 
+try:
+    # Optional: orjson parses the config faster, straight from bytes
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Prompts configuration shipped with the package
+_DEFAULT_PROMPTS_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompts-config.json')
+
+
+@lru_cache(maxsize=8)
+def _read_prompts_config(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Read and parse a prompts configuration file once per process.
+    
+    The modification time is part of the cache key, so an edited file is read again.
+    The result is shared between callers; copy it before handing it out.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+@lru_cache(maxsize=64)
+def _read_template(path: str, mtime: float) -> str:
+    """
+    Read a template file once per process.
+    
+    The modification time is part of the cache key, so an edited file is read again.
+    """
+    with open(path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template_content: str) -> Template:
+    """Compile a template once per process, every render after that reuses it."""
+    return Template(template_content)
+
 
 class TemplateManager:
     """Manages loading templates and prompt configurations."""
     
-    def __init__(self, template_dir: str, prompts_config_path: str):
+    def __init__(self, template_dir: str, prompts_config_path: str = _DEFAULT_PROMPTS_CONFIG_PATH):
         """
         Initialize the TemplateManager.
         
         Args:
             template_dir: Directory containing template files (.txt)
             prompts_config_path: Path to the prompts configuration JSON file
+                (defaults to the prompts-config.json next to this module)
         """
         self.template_dir = template_dir
         self.prompts_config_path = prompts_config_path
@@ -28,8 +70,9 @@ class TemplateManager:
         if not os.path.exists(self.prompts_config_path):
             raise FileNotFoundError(f"Prompts configuration file '{self.prompts_config_path}' not found")
         
-        with open(self.prompts_config_path, 'r') as f:
-            full_config = json.load(f)
+        # Each manager gets its own copy, so changing it leaves the cached config intact
+        full_config = copy.deepcopy(_read_prompts_config(self.prompts_config_path,
+                                                         os.path.getmtime(self.prompts_config_path)))
             
         self.system_prompt = full_config.get("system_prompt", "You are a helpful AI assistant.") # Default fallback
         self.template_prompts = full_config.get("template_prompts", {})
@@ -57,11 +100,12 @@ class TemplateManager:
         """
         template_path = os.path.join(self.template_dir, template_name)
         
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Template '{template_path}' not found")
+        try:
+            mtime = os.path.getmtime(template_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template '{template_path}' not found") from None
         
-        with open(template_path, 'r') as f:
-            return f.read()
+        return _read_template(template_path, mtime)
     
     def render_template(self, template_content: str, context: Dict[str, Any]) -> str:
         """
@@ -74,5 +118,4 @@ class TemplateManager:
         Returns:
             Rendered template as a string
         """
-        template = Template(template_content)
-        return template.render(**context)
\ No newline at end of file
+        return _compile_template(template_content).render(**context)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Tests for OllamaClient._clean_stream, the streaming counterpart of _clean_response.
+"""
+
+import random
+import unittest
+
+from issue_generator.ollama_client import OllamaClient
+
+
+class CleanStreamTest(unittest.TestCase):
+    """The joined output of _clean_stream must equal _clean_response of the joined input."""
+
+    def setUp(self):
+        self.client = OllamaClient()
+
+    def clean_stream(self, chunks):
+        return "".join(self.client._clean_stream(iter(chunks)))
+
+    def assertMatchesResponse(self, chunks):
+        expected = self.client._clean_response("".join(chunks))
+        self.assertEqual(self.clean_stream(chunks), expected)
+        return expected
+
+    def test_text_without_tags_is_unchanged(self):
+        self.assertEqual(self.clean_stream(["Some ", "generated ", "text."]), "Some generated text.")
+
+    def test_text_is_yielded_before_the_stream_ends(self):
+        def chunks():
+            yield "First sentence. "
+            raise AssertionError("next chunk requested before the first one was yielded")
+
+        self.assertEqual(next(self.client._clean_stream(chunks())), "First sentence.")
+
+    def test_think_block_is_removed(self):
+        self.assertEqual(self.assertMatchesResponse(["<think>hmm</think>Answer"]), "Answer")
+
+    def test_opening_tag_split_across_chunks(self):
+        self.assertEqual(self.assertMatchesResponse(["<thi", "nk>hmm</think>Answer"]), "Answer")
+
+    def test_closing_tag_split_across_chunks(self):
+        self.assertEqual(self.assertMatchesResponse(["<think>hmm</", "thi", "nk>Answer"]), "Answer")
+
+    def test_tag_split_after_another_angle_bracket(self):
+        self.assertEqual(self.assertMatchesResponse(["a <", "<", "THINK", ">b</think>c"]), "a <c")
+
+    def test_tags_are_case_insensitive(self):
+        self.assertEqual(self.assertMatchesResponse(["<THINK>hmm</Think>Answer"]), "Answer")
+
+    def test_stray_closing_tag_is_removed(self):
+        self.assertEqual(self.assertMatchesResponse(["Answer</thi", "nk> here"]), "Answer here")
+
+    def test_unclosed_block_is_kept_without_its_tags(self):
+        self.assertEqual(self.assertMatchesResponse(["<think>Answer <thi", "nk>anyway"]), "Answer anyway")
+
+    def test_answer_inside_think_block_falls_back_to_last_paragraph(self):
+        chunks = ["<think>Reasoning first.\n", "\nThe answer", "</think>", "\n"]
+        self.assertEqual(self.assertMatchesResponse(chunks), "The answer")
+
+    def test_empty_think_block_falls_back_to_the_raw_response(self):
+        self.assertEqual(self.assertMatchesResponse(["<think>", "</think>"]), "<think></think>")
+
+    def test_blank_lines_collapse_across_chunks(self):
+        self.assertEqual(self.assertMatchesResponse(["* a\n", "\n", " \n", "* b"]), "* a\n\n* b")
+
+    def test_blank_lines_collapse_around_removed_block(self):
+        self.assertEqual(self.assertMatchesResponse(["a\n\n<think>x</think>\n\nb"]), "a\n\nb")
+
+    def test_surrounding_whitespace_is_stripped(self):
+        self.assertEqual(self.assertMatchesResponse(["\n  ", "Answer", " \n", "\n"]), "Answer")
+
+    def test_random_chunking_matches_clean_response(self):
+        pieces = ["<think>", "</think>", "<THINK>", "<thi", "nk>", "</", "<", "word", " ", "\t", "\n", "\n \n"]
+        rng = random.Random(0)
+        for _ in range(5000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 20)))
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 8))))
+            chunks = [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+            with self.subTest(chunks=chunks):
+                self.assertMatchesResponse(chunks)
+
+
+if __name__ == "__main__":
+    unittest.main()
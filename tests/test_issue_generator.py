@@ -0,0 +1,185 @@
+"""
+Tests for IssueGenerator, with a fake ollama SDK client in place of a server.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from issue_generator.issue_generator import IssueGenerator
+from issue_generator.ollama_client import OllamaClient
+from issue_generator.template_manager import TemplateManager
+
+PROMPTS_CONFIG = {
+    "system_prompt": "You write issues.",
+    "template_prompts": {
+        "titel": {"type": "header", "args": {"word_limit": 5}},
+        "label": {"type": "selection", "args": {"options": ["LCM (Life Cycle Management)", "Beheer", "Beheer (duplicate)"]}},
+        "actor": {"type": "selection", "args": {"options": ["Tester", "Developer"], "multiple": True}},
+        "reviewer": {"type": "selection", "args": {"options": ["Tester", "Developer"]}},
+        "team": {"type": "selection", "args": {"options": ["Ypsilon (the scrum team)"]}},
+        "risks": {"type": "bullets", "args": {"bullet_limit": 0}},
+        "notes": {"type": "bullets", "additional_info": "Always list the open questions."},
+        "untyped": {"prompt": "Write {context}"},
+    },
+}
+
+TEMPLATE = "{{ titel }}|{{ label }}|{{ actor }}|{{ reviewer }}|{{ team }}|{{ risks }}|{{ notes }}|{{ untyped }}\n"
+
+
+class FakeSDKClient:
+    """Stands in for ollama.Client and ollama.AsyncClient, answering through a reply function."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    def _generate(self, params):
+        self.requests.append(params)
+        answer = self.reply(params)
+        if isinstance(answer, Exception):
+            raise answer
+        return {"response": answer, "prompt_eval_count": 1, "eval_count": 1, "eval_duration": 1000}
+
+    def generate(self, **params):
+        return self._generate(params)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncSDKClient(FakeSDKClient):
+
+    async def generate(self, **params):
+        return self._generate(params)
+
+    async def close(self):
+        pass
+
+
+def default_reply(params):
+    """Answer like a server with structured output support."""
+    schema = params.get("format")
+    if isinstance(schema, dict) and schema["type"] == "array":
+        return json.dumps(schema["items"]["enum"][:1])
+    if isinstance(schema, dict):
+        return json.dumps({field: f"batched {field}" for field in schema["properties"]})
+    return "generated text"
+
+
+class IssueGeneratorTest(unittest.TestCase):
+
+    def setUp(self):
+        # Fallbacks log warnings, which are expected here
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        config_path = os.path.join(directory.name, "prompts-config.json")
+        with open(config_path, "w") as f:
+            json.dump(PROMPTS_CONFIG, f)
+        with open(os.path.join(directory.name, "test_template.txt"), "w") as f:
+            f.write(TEMPLATE)
+        self.template_manager = TemplateManager(directory.name, config_path)
+
+        self.reply = default_reply
+        self.sdk = FakeSDKClient(lambda params: self.reply(params))
+        self.async_sdk = FakeAsyncSDKClient(lambda params: self.reply(params))
+        for name, fake in (("Client", self.sdk), ("AsyncClient", self.async_sdk)):
+            patcher = mock.patch(f"issue_generator.ollama_client.ollama.{name}", return_value=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def generator(self, **kwargs):
+        client = OllamaClient(system_prompt=self.template_manager.get_system_prompt(), max_retries=0)
+        return IssueGenerator(self.template_manager, client, enable_cache=False, **kwargs)
+
+    def test_selection_schema_drops_notes_and_duplicates(self):
+        schema = self.generator()._field_formats["label"]
+        self.assertEqual(schema, {"type": "array", "items": {"type": "string", "enum": ["LCM", "Beheer"]},
+                                  "minItems": 1, "maxItems": 1})
+
+    def test_multiple_selection_has_no_max_items(self):
+        self.assertNotIn("maxItems", self.generator()._field_formats["actor"])
+
+    def test_field_answer_joins_selected_options(self):
+        generator = self.generator()
+        self.assertEqual(generator._field_answer("actor", ["Tester", "Developer"]), "Tester, Developer")
+        self.assertEqual(generator._field_answer("actor", '["Tester", "Developer"]'), "Tester, Developer")
+
+    def test_field_answer_keeps_text_that_is_not_json(self):
+        self.assertEqual(self.generator()._field_answer("label", "Beheer"), "Beheer")
+
+    def test_field_answer_leaves_other_fields_alone(self):
+        self.assertEqual(self.generator()._field_answer("titel", '["A title"]'), '["A title"]')
+
+    def test_known_answers(self):
+        generator = self.generator()
+        self.assertEqual(generator._known_answer("context", "team"), "Ypsilon")
+        self.assertEqual(generator._known_answer("context", "risks"), "")
+        self.assertIsNone(generator._known_answer("context", "titel"))
+
+    def test_empty_context_only_generates_fields_with_additional_info(self):
+        generator = self.generator()
+        self.assertEqual(generator._known_answer("  \n", "titel"), "<!-- Missing content for titel -->")
+        self.assertIsNone(generator._known_answer("  \n", "notes"))
+
+    def test_batch_schema_constrains_selection_fields(self):
+        generator = self.generator()
+        schema = generator._batch_schema(["titel", "label"])
+        self.assertEqual(schema["properties"]["titel"], {"type": "string"})
+        self.assertEqual(schema["properties"]["label"], generator._field_formats["label"])
+        self.assertEqual(schema["required"], ["titel", "label"])
+
+    def test_parse_batch_response(self):
+        response = json.dumps({"titel": " A title ", "label": ["Beheer"], "notes": ["* one", "* two"],
+                               "actor": "  ", "extra": "ignored"})
+        parsed = self.generator()._parse_batch_response(response, ["titel", "label", "notes", "actor"])
+        self.assertEqual(parsed, {"titel": "A title", "label": "Beheer", "notes": "* one\n* two"})
+
+    def test_parse_batch_response_rejects_other_json(self):
+        generator = self.generator()
+        with self.assertRaises(ValueError):
+            generator._parse_batch_response("not json", ["titel"])
+        with self.assertRaises(ValueError):
+            generator._parse_batch_response('["titel"]', ["titel"])
+
+    def test_full_issue_in_a_single_batched_request(self):
+        issue = self.generator().generate_full_issue("context", "test_template.txt")
+        self.assertEqual(issue, "batched titel|batched label|batched actor|batched reviewer|Ypsilon||"
+                                "batched notes|<!-- Missing content for untyped -->")
+        self.assertEqual(len(self.async_sdk.requests), 1)
+
+    def test_unparseable_batch_falls_back_to_per_field_requests(self):
+        self.reply = lambda params: "no json" if params.get("format", {}).get("type") == "object" \
+            else default_reply(params)
+        issue = self.generator().generate_full_issue("context", "test_template.txt")
+        self.assertEqual(issue, "generated text|LCM|Tester|Tester|Ypsilon||generated text|"
+                                "<!-- Missing content for untyped -->")
+
+    def test_failed_batch_falls_back_to_per_field_requests(self):
+        self.reply = lambda params: httpx.ReadTimeout("") if params.get("format", {}).get("type") == "object" \
+            else default_reply(params)
+        issue = self.generator().generate_full_issue("context", "test_template.txt")
+        self.assertTrue(issue.startswith("generated text|LCM|"))
+
+    def test_fields_with_different_formats_are_not_merged(self):
+        self.generator(batch_fields=False).generate_full_issue("context", "test_template.txt")
+        selection_formats = [request["format"] for request in self.async_sdk.requests
+                             if request.get("format", {}).get("type") == "array"]
+        self.assertEqual(len(selection_formats), 3)  # label, actor and reviewer
+
+    def test_empty_capped_field_is_requested_without_its_limit(self):
+        self.reply = lambda params: "" if params["options"]["num_predict"] < 2048 else "generated text"
+        self.assertEqual(self.generator().generate_issue_content("context", "titel"), "generated text")
+        self.assertEqual([request["options"]["num_predict"] for request in self.sdk.requests], [52, 2048])
+
+
+if __name__ == "__main__":
+    unittest.main()